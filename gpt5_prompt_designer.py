@@ -11,41 +11,58 @@ GPT-5 Prompt Designer (PySide6)
 from __future__ import annotations
 
 import json
-import os
 import re
 import sys
-from dataclasses import dataclass, field
-from typing import List, Dict, Tuple
+import time
+from dataclasses import dataclass, field, fields, replace
+from typing import List, Dict, Sequence, Tuple
 
-from PySide6.QtCore import Qt
+try:
+    import orjson  # optional: faster settings save/load
+except ImportError:
+    orjson = None
+
+from PySide6.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex, QSignalBlocker
 from PySide6.QtGui import QAction, QCloseEvent
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
     QLabel, QLineEdit, QTextEdit, QPushButton, QComboBox, QCheckBox, QFileDialog,
-    QTableWidget, QTableWidgetItem, QAbstractItemView, QMessageBox, QFormLayout,
+    QTableView, QAbstractItemView, QMessageBox, QFormLayout,
     QSplitter, QSizePolicy
 )
 
 APP_TITLE = "GPT-5 Prompt Designer"
 APP_VERSION = "1.0.0"
 
+SAVE_SETTINGS_TITLE = "Save Settings"
+LOAD_SETTINGS_TITLE = "Load Settings"
+SETTINGS_FILTER = "JSON (*.json)"
+SETTINGS_DEFAULT_NAME = "prompt_settings.json"
+
 # ---------- Utilities ----------
 
+_NEWLINES_RE = re.compile(r'\n{3,}')
+_VAR_RE = re.compile(r"\{([A-Za-z0-9_]+)\}")
+
 def clamp_text(s: str) -> str:
-    return re.sub(r'\n{3,}', '\n\n', s).strip()
+    if '\n\n\n' not in s:
+        return s.strip()
+    return _NEWLINES_RE.sub('\n\n', s).strip()
 
 def replace_vars(text: str, mapping: Dict[str, str]) -> str:
-    def repl(m):
-        key = m.group(1)
-        return mapping.get(key, m.group(0))
-    return re.sub(r"\{([A-Za-z0-9_]+)\}", repl, text)
+    # str.format_map would mangle "{{", format specs and JSON braces, so keep
+    # the regex and skip it entirely when nothing can be substituted.
+    if not mapping or "{" not in text:
+        return text
+    get = mapping.get
+    return _VAR_RE.sub(lambda m: get(m.group(1), m.group(0)), text)
 
 def safe_json(s: str) -> str:
     return json.dumps(s, ensure_ascii=False)
 
 # ---------- Prompt assembly ----------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PromptOptions:
     # Basics
     role: str = "General assistant"
@@ -97,174 +114,369 @@ class PromptOptions:
     include_swe_bench: bool = False
     include_retail_min_reason: bool = False
 
+    def as_dict(self) -> Dict[str, object]:
+        # Shallow field -> value mapping for serialization. Unlike
+        # dataclasses.asdict it does not deep-copy the examples/variables.
+        return {name: getattr(self, name) for name in _OPTION_FIELDS}
+
+_OPTION_FIELDS: Tuple[str, ...] = tuple(f.name for f in fields(PromptOptions))
+
+def check_settings(data: Dict[str, object]) -> None:
+    """Raise ValueError if loaded settings do not have the shapes PromptOptions expects."""
+    for f in fields(PromptOptions):
+        if f.name not in data:
+            continue
+        value = data[f.name]
+        if f.name == "examples":
+            if not isinstance(value, list) or not all(
+                    isinstance(ex, (list, tuple)) and len(ex) == 2 and all(isinstance(t, str) for t in ex)
+                    for ex in value):
+                raise ValueError("'examples' must be a list of [user, assistant] string pairs")
+        elif f.name == "variables":
+            if not isinstance(value, dict) or not all(isinstance(v, str) for v in value.values()):
+                raise ValueError("'variables' must be an object of string values")
+        elif not isinstance(value, type(f.default)):
+            raise ValueError(f"'{f.name}' must be a {type(f.default).__name__}")
+
+_MD_GUIDANCE = (
+    "Format the final answer in Markdown where semantically correct. Use inline code, fenced code blocks, lists, and tables appropriately.\n"
+    "When naming files or code elements, use backticks; use \\( \\) for inline math and \\[ \\] for block math."
+)
+_JSON_SCHEMA_INTRO = "Return a single JSON object that exactly follows this JSON Schema:"
+_JSON_BARE = "Return a single valid JSON object with keys appropriate to the task. No extra commentary."
+
+_DELIM_MAP: Dict[str, Tuple[str, str]] = {
+    "triple backticks": ("```", "```"),
+    "triple quotes": ('"""', '"""'),
+    "XML tags": ("<content>", "</content>"),
+}
+
 class PromptBuilder:
     def __init__(self, opts: PromptOptions):
         self.o = opts
+        self._open, self._close = _DELIM_MAP.get(opts.delimiters, ("```", "```"))
+
+    # Each _emit_* method appends the lines of one prompt section to `out`.
+    # Sections that are disabled or empty append nothing.
 
-    def _delim(self) -> Tuple[str, str]:
-        d = self.o.delimiters
-        if d == "triple backticks":
-            return ("```", "```")
-        if d == "triple quotes":
-            return ('"""', '"""')
-        if d == "XML tags":
-            return ("<content>", "</content>")
-        return ("```", "```")
-
-    def _role_line(self) -> str:
+    def _emit_role(self, out: List[str]) -> None:
         role = self.o.custom_role.strip() if self.o.role == "Custom" else self.o.role
         if not role:
             role = "General assistant"
-        return f"You are {role}."
+        out.append(f"You are {role}.")
+
+    def _emit_task(self, out: List[str]) -> None:
+        if self.o.task.strip():
+            out.extend(("Task " + self._open, clamp_text(self.o.task), self._close))
 
-    def _audience_line(self) -> str:
+    def _emit_context(self, out: List[str]) -> None:
+        if self.o.additional_context.strip():
+            out.extend(("Context " + self._open, clamp_text(self.o.additional_context), self._close))
+
+    def _emit_audience(self, out: List[str]) -> None:
         aud = self.o.audience.strip()
-        return f"Target audience: {aud}." if aud else ""
+        if aud:
+            out.append(f"Target audience: {aud}.")
 
-    def _constraints_block(self) -> str:
+    def _emit_constraints(self, out: List[str]) -> None:
+        if not self.o.constraints:
+            return
         cons = clamp_text(self.o.constraints)
-        return f"Constraints:\n- {cons.replace(os.linesep, os.linesep+'- ')}" if cons else ""
+        if cons:
+            bulleted = "\n- ".join(ln for ln in cons.split("\n") if ln.strip())
+            out.append(f"Constraints:\n- {bulleted}")
 
-    def _formatting_block(self) -> str:
-        parts = []
+    def _emit_formatting(self, out: List[str]) -> None:
         if self.o.output_format == "Markdown" or self.o.markdown_guidance:
-            parts.append("Format the final answer in Markdown where semantically correct. Use inline code, fenced code blocks, lists, and tables appropriately.")
-            parts.append("When naming files or code elements, use backticks; use \\( \\) for inline math and \\[ \\] for block math.")
+            out.append(_MD_GUIDANCE)
         if self.o.output_format == "JSON":
-            schema = clamp_text(self.o.json_schema)
+            schema = clamp_text(self.o.json_schema) if self.o.json_schema else ""
             if schema:
-                parts.append("Return a single JSON object that exactly follows this JSON Schema:")
-                parts.append(schema)
+                out.extend((_JSON_SCHEMA_INTRO, schema))
             else:
-                parts.append("Return a single valid JSON object with keys appropriate to the task. No extra commentary.")
-        return "\n".join(parts)
+                out.append(_JSON_BARE)
 
-    def _verbosity_block(self) -> str:
+    def _emit_verbosity(self, out: List[str]) -> None:
         v = self.o.verbosity
+        override = self.o.verbosity_override.strip()
         if v == "Default":
-            return self.o.verbosity_override.strip()
-        return f"Verbosity: {v.lower()}." + (f" {self.o.verbosity_override.strip()}" if self.o.verbosity_override.strip() else "")
+            if override:
+                out.append(override)
+            return
+        out.append(f"Verbosity: {v.lower()}." + (f" {override}" if override else ""))
 
-    def _reasoning_block(self) -> str:
+    def _emit_reasoning(self, out: List[str]) -> None:
         r = self.o.reasoning_effort
-        if r == "Default":
-            return ""
-        return f"Reasoning effort: {r.lower()}."
+        if r != "Default":
+            out.append(f"Reasoning effort: {r.lower()}.")
 
-    def _agentic_controls(self) -> str:
-        lines = []
+    def _emit_agentic(self, out: List[str]) -> None:
         e = self.o.eagerness
         if e == "Low":
-            lines.append("Agentic eagerness: low. Avoid tangential tool calls. Ask at most one clarifying question only if blocking.")
+            out.append("Agentic eagerness: low. Avoid tangential tool calls. Ask at most one clarifying question only if blocking.")
         elif e == "High":
-            lines.append("Agentic eagerness: high. Be proactive. Decompose the task and use available tools when helpful.")
+            out.append("Agentic eagerness: high. Be proactive. Decompose the task and use available tools when helpful.")
         else:
-            lines.append("Agentic eagerness: medium. Balance proactivity with directness.")
+            out.append("Agentic eagerness: medium. Balance proactivity with directness.")
         if self.o.include_tool_preamble:
-            lines.append("Before tools: emit a short tool preamble that restates the goal, the plan, and the next action.")
+            out.append("Before tools: emit a short tool preamble that restates the goal, the plan, and the next action.")
         if self.o.include_progress_narration:
-            lines.append("During long tasks: include brief progress updates and what remains.")
+            out.append("During long tasks: include brief progress updates and what remains.")
         if self.o.include_persistence:
-            lines.append("Agentic persistence: continue until the user's goal is fully achieved. Do not stop early.")
+            out.append("Agentic persistence: continue until the user's goal is fully achieved. Do not stop early.")
         if self.o.include_tool_disambiguation:
             tc = clamp_text(self.o.tool_context)
             if tc:
-                lines.append("Tool instructions: follow these disambiguated tool rules:")
-                lines.append(tc)
-        return "\n".join(lines)
+                out.extend(("Tool instructions: follow these disambiguated tool rules:", tc))
 
-    def _planning_block(self) -> str:
+    def _emit_planning(self, out: List[str]) -> None:
         if not self.o.include_planning:
-            return ""
+            return
         snippet = clamp_text(self.o.planning_snippet or
                              "Plan the steps before producing the final answer. Verify each step. Do not yield until all sub-tasks are complete.")
-        return f"Planning:\n{snippet}"
+        out.append(f"Planning:\n{snippet}")
 
-    def _coding_block(self) -> str:
+    def _emit_coding(self, out: List[str]) -> None:
         if not self.o.coding_mode:
-            return ""
-        lines = ["Coding mode: enabled. Prefer small, verifiable steps and runnable outputs."]
+            return
+        out.append("Coding mode: enabled. Prefer small, verifiable steps and runnable outputs.")
         if self.o.include_apply_patch_instr:
-            lines.append("For code edits, prefer unified diffs in an apply_patch block: begin with '*** Begin Patch' and end with '*** End Patch'.")
+            out.append("For code edits, prefer unified diffs in an apply_patch block: begin with '*** Begin Patch' and end with '*** End Patch'.")
         if self.o.include_tool_defs:
-            lines.append("Assume standard code tools are available as defined by the host environment. Use them when appropriate.")
-        notes = clamp_text(self.o.coding_notes)
+            out.append("Assume standard code tools are available as defined by the host environment. Use them when appropriate.")
+        notes = clamp_text(self.o.coding_notes) if self.o.coding_notes else ""
         if notes:
-            lines.append(notes)
-        return "\n".join(lines)
+            out.append(notes)
 
-    def _examples_block(self) -> str:
+    def _emit_examples(self, out: List[str]) -> None:
         if not self.o.examples:
-            return ""
-        open_d, close_d = self._delim()
-        lines = ["Few-shot examples:"]
+            return
+        out.append("Few-shot examples:")
+        # Runs of blank lines are collapsed by the final clamp_text in build().
         for i, (u, a) in enumerate(self.o.examples, 1):
-            u = clamp_text(u)
-            a = clamp_text(a)
-            lines.append(f"Example {i} - user {open_d}\n{u}\n{close_d}")
-            lines.append(f"Example {i} - assistant {open_d}\n{a}\n{close_d}")
-        return "\n".join(lines)
-
-    def _appendix_block(self) -> str:
-        lines = []
+            u = u.strip()
+            a = a.strip()
+            out.extend((f"Example {i} - user {self._open}", u, self._close))
+            out.extend((f"Example {i} - assistant {self._open}", a, self._close))
+
+    def _emit_appendix(self, out: List[str]) -> None:
         if self.o.include_swe_bench:
-            lines.append("Appendix: When editing code, use an apply_patch block with a unified diff. Verify changes thoroughly and consider hidden tests.")
+            out.append("Appendix: When editing code, use an apply_patch block with a unified diff. Verify changes thoroughly and consider hidden tests.")
         if self.o.include_retail_min_reason:
-            lines.append("Appendix: Retail domain guardrails. Authenticate the user first. Only act for the authenticated user. Before database changes, summarize the action and get explicit confirmation.")
-        return "\n".join(lines)
+            out.append("Appendix: Retail domain guardrails. Authenticate the user first. Only act for the authenticated user. Before database changes, summarize the action and get explicit confirmation.")
+
+    def _emit_rationale(self, out: List[str]) -> None:
+        if self.o.ask_brief_rationale:
+            out.append("Begin the final answer with 1-3 concise bullets summarizing key factors. Do not include private chain-of-thought.")
 
-    def _meta_prompt(self) -> str:
-        # Build metaprompt text
-        open_d, close_d = self._delim()
+    def _emit_meta_prompt(self, out: List[str]) -> None:
         base = clamp_text(self.o.meta_prompt)
         desired = clamp_text(self.o.meta_desired)
         undesired = clamp_text(self.o.meta_undesired)
-        lines = [
+        out.extend((
             "Optimize the following prompt. Explain what minimal edits or additions would encourage the desired behavior and reduce undesired behavior.",
             f"Desired behavior: {desired}" if desired else "Desired behavior: (not provided)",
             f"Undesired behavior: {undesired}" if undesired else "Undesired behavior: (not provided)",
-            f"Prompt {open_d}\n{base}\n{close_d}"
-        ]
-        return "\n".join(lines)
+            "Prompt " + self._open,
+            base,
+            self._close,
+        ))
+
+    # Prompt sections in output order
+    _SECTIONS = (
+        _emit_role,
+        _emit_task,
+        _emit_context,
+        _emit_audience,
+        _emit_constraints,
+        _emit_verbosity,
+        _emit_reasoning,
+        _emit_agentic,
+        _emit_planning,
+        _emit_coding,
+        _emit_examples,
+        _emit_formatting,
+        _emit_appendix,
+        _emit_rationale,
+    )
 
     def build(self) -> str:
+        # All sections write into one line list that is joined exactly once.
+        out: List[str] = []
         if self.o.meta_mode:
-            composed = self._meta_prompt()
-            return clamp_text(replace_vars(composed, self.o.variables))
+            self._emit_meta_prompt(out)
+            return clamp_text(replace_vars("\n".join(out), self.o.variables))
 
-        parts = []
-        parts.append(self._role_line())
-        if self.o.task.strip():
-            open_d, close_d = self._delim()
-            parts.append(f"Task {open_d}\n{clamp_text(self.o.task)}\n{close_d}")
-        if self.o.additional_context.strip():
-            open_d, close_d = self._delim()
-            parts.append(f"Context {open_d}\n{clamp_text(self.o.additional_context)}\n{close_d}")
-
-        for piece in [
-            self._audience_line(),
-            self._constraints_block(),
-            self._verbosity_block(),
-            self._reasoning_block(),
-            self._agentic_controls(),
-            self._planning_block(),
-            self._coding_block(),
-            self._examples_block(),
-            self._formatting_block(),
-            self._appendix_block(),
-        ]:
-            if piece.strip():
-                parts.append(piece.strip())
-
-        if self.o.ask_brief_rationale:
-            parts.append("Begin the final answer with 1-3 concise bullets summarizing key factors. Do not include private chain-of-thought.")
+        for emit in self._SECTIONS:
+            mark = len(out)
+            emit(self, out)
+            if len(out) > mark:
+                out.append("")  # blank line between sections
 
-        composed = clamp_text("\n\n".join(p for p in parts if p.strip()))
+        composed = clamp_text("\n".join(out))
         composed = replace_vars(composed, self.o.variables)
         return composed
 
 # ---------- GUI ----------
 
+class PairModel(QAbstractTableModel):
+    """Editable two-column table model backed by a plain list of [first, second] rows."""
+
+    def __init__(self, headers: Tuple[str, str], parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._rows: List[List[str]] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if index.isValid() and role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self._rows[index.row()][index.column()]
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        self._rows[index.row()][index.column()] = str(value)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def removeRows(self, row, count, parent=QModelIndex()) -> bool:
+        if parent.isValid() or count <= 0 or row < 0 or row + count > len(self._rows):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._rows[row:row + count]
+        self.endRemoveRows()
+        return True
+
+    def rows(self) -> List[List[str]]:
+        return self._rows
+
+    def set_rows(self, rows):
+        # Build the new rows first so a malformed row cannot leave a reset open
+        new_rows = [[first, second] for first, second in rows]
+        self.beginResetModel()
+        self._rows = new_rows
+        self.endResetModel()
+
+    def append_row(self, first: str, second: str):
+        self.append_rows([(first, second)])
+
+    def append_rows(self, rows: Sequence[Tuple[str, str]]):
+        new_rows = [[first, second] for first, second in rows]
+        if not new_rows:
+            return
+        r = len(self._rows)
+        self.beginInsertRows(QModelIndex(), r, r + len(new_rows) - 1)
+        self._rows.extend(new_rows)
+        self.endInsertRows()
+
+_PRESETS: Dict[str, PromptOptions] = {
+    "General task": PromptOptions(
+        role="General assistant",
+        markdown_guidance=True,
+        verbosity="Medium",
+        eagerness="Medium",
+        delimiters="triple backticks",
+    ),
+    "Agentic low-eagerness": PromptOptions(
+        include_persistence=True,
+        include_tool_preamble=True,
+        eagerness="Low",
+        reasoning_effort="Minimal",
+        ask_brief_rationale=False,
+        markdown_guidance=True,
+        verbosity="Low",
+    ),
+    "Agentic high-eagerness": PromptOptions(
+        include_persistence=True,
+        include_tool_preamble=True,
+        include_progress_narration=True,
+        include_tool_disambiguation=True,
+        eagerness="High",
+        reasoning_effort="Medium",
+        markdown_guidance=True,
+        verbosity="Medium",
+    ),
+    "Coding workflow": PromptOptions(
+        role="Coding assistant",
+        coding_mode=True,
+        include_planning=True,
+        include_apply_patch_instr=True,
+        include_tool_defs=True,
+        markdown_guidance=True,
+        verbosity="Medium",
+        reasoning_effort="Medium",
+        include_persistence=True,
+        eagerness="Medium",
+    ),
+    "Metaprompt optimizer": PromptOptions(
+        meta_mode=True,
+        verbosity="Low",
+        markdown_guidance=False,
+        eagerness="Low",
+    ),
+}
+
+_STARTER_VARS: Tuple[Tuple[str, str], ...] = (
+    ("LANG", "Python"),
+    ("FRAMEWORK", "FastAPI"),
+    ("DEADLINE", "2025-10-31"),
+)
+
+# (widget attribute, setter, PromptOptions field) used by MainWindow._apply_options
+_WIDGET_SETTERS: Tuple[Tuple[str, str, str], ...] = (
+    # Basics
+    ("custom_role", "setText", "custom_role"),
+    ("task_edit", "setPlainText", "task"),
+    ("context_edit", "setPlainText", "additional_context"),
+    ("audience_edit", "setText", "audience"),
+    ("constraints_edit", "setPlainText", "constraints"),
+    ("delim_combo", "setCurrentText", "delimiters"),
+    ("output_format_combo", "setCurrentText", "output_format"),
+    ("json_schema_edit", "setPlainText", "json_schema"),
+    # Agentic
+    ("eager_combo", "setCurrentText", "eagerness"),
+    ("reasoning_combo", "setCurrentText", "reasoning_effort"),
+    ("chk_tool_preamble", "setChecked", "include_tool_preamble"),
+    ("chk_persistence", "setChecked", "include_persistence"),
+    ("chk_progress", "setChecked", "include_progress_narration"),
+    ("chk_tool_rules", "setChecked", "include_tool_disambiguation"),
+    ("tool_rules_edit", "setPlainText", "tool_context"),
+    # Coding
+    ("chk_coding", "setChecked", "coding_mode"),
+    ("chk_planning", "setChecked", "include_planning"),
+    ("planning_edit", "setPlainText", "planning_snippet"),
+    ("chk_apply_patch", "setChecked", "include_apply_patch_instr"),
+    ("chk_tool_defs", "setChecked", "include_tool_defs"),
+    ("coding_notes", "setPlainText", "coding_notes"),
+    # Intelligence
+    ("verbosity_combo", "setCurrentText", "verbosity"),
+    ("verbosity_override", "setText", "verbosity_override"),
+    ("chk_markdown", "setChecked", "markdown_guidance"),
+    ("chk_brief_rationale", "setChecked", "ask_brief_rationale"),
+    # Metaprompt
+    ("chk_meta_mode", "setChecked", "meta_mode"),
+    ("meta_prompt", "setPlainText", "meta_prompt"),
+    ("meta_desired", "setText", "meta_desired"),
+    ("meta_undesired", "setText", "meta_undesired"),
+    # Appendices
+    ("chk_swe", "setChecked", "include_swe_bench"),
+    ("chk_retail", "setChecked", "include_retail_min_reason"),
+)
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -272,6 +484,11 @@ class MainWindow(QMainWindow):
         self.resize(1200, 800)
 
         self.opts = PromptOptions()
+        self._options_cache = None  # last _collect_options() result; cleared on any edit
+        self._settings_cache = None  # (options, serialized bytes) from the last save
+        self._save_dialog = None
+        self._open_dialog = None
+        self._status_shown_at = 0.0  # time.monotonic() of the last _show_status
         self._init_ui()
         self._wire_actions()
 
@@ -305,13 +522,21 @@ class MainWindow(QMainWindow):
         main_layout.addLayout(top_bar)
 
         # Tabs + Output
+        # Tab contents are built on first visit (see _build_tab); each tab
+        # starts as an empty page that the builder's widget is added to.
         self.tabs = QTabWidget()
-        self._init_tab_basics()
-        self._init_tab_agentic()
-        self._init_tab_coding()
-        self._init_tab_intelligence()
-        self._init_tab_examples()
-        self._init_tab_variables()
+        self._tab_builders = {}
+        for name, builder in (
+            ("Basics", self._init_tab_basics),
+            ("Agentic", self._init_tab_agentic),
+            ("Coding", self._init_tab_coding),
+            ("Intelligence", self._init_tab_intelligence),
+            ("Few-shot", self._init_tab_examples),
+            ("Variables & Appendices", self._init_tab_variables),
+        ):
+            page = QWidget()
+            QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
+            self._tab_builders[self.tabs.addTab(page, name)] = builder
         main_layout.addWidget(self.tabs, stretch=1)
 
         # Output area and controls
@@ -375,7 +600,7 @@ class MainWindow(QMainWindow):
         layout.addRow("Output format", self.output_format_combo)
         layout.addRow("JSON Schema", self.json_schema_edit)
 
-        self.tabs.addTab(w, "Basics")
+        return w
 
     def _init_tab_agentic(self):
         w = QWidget()
@@ -403,7 +628,7 @@ class MainWindow(QMainWindow):
         layout.addRow(self.chk_tool_rules)
         layout.addRow("Tool rules", self.tool_rules_edit)
 
-        self.tabs.addTab(w, "Agentic")
+        return w
 
     def _init_tab_coding(self):
         w = QWidget()
@@ -428,7 +653,7 @@ class MainWindow(QMainWindow):
         layout.addRow(self.chk_tool_defs)
         layout.addRow("Extra coding notes", self.coding_notes)
 
-        self.tabs.addTab(w, "Coding")
+        return w
 
     def _init_tab_intelligence(self):
         w = QWidget()
@@ -459,14 +684,15 @@ class MainWindow(QMainWindow):
         layout.addRow("Desired behavior", self.meta_desired)
         layout.addRow("Undesired behavior", self.meta_undesired)
 
-        self.tabs.addTab(w, "Intelligence")
+        return w
 
     def _init_tab_examples(self):
         w = QWidget()
         v = QVBoxLayout(w)
 
-        self.examples_table = QTableWidget(0, 2)
-        self.examples_table.setHorizontalHeaderLabels(["User", "Assistant"])
+        self.examples_model = PairModel(("User", "Assistant"), self)
+        self.examples_table = QTableView()
+        self.examples_table.setModel(self.examples_model)
         self.examples_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.examples_table.setEditTriggers(QAbstractItemView.AllEditTriggers)
         self.examples_table.horizontalHeader().setStretchLastSection(True)
@@ -482,14 +708,19 @@ class MainWindow(QMainWindow):
         btns.addWidget(self.insert_example_btn)
         v.addLayout(btns)
 
-        self.tabs.addTab(w, "Few-shot")
+        self.add_example_btn.clicked.connect(self._add_example_row)
+        self.del_example_btn.clicked.connect(self._del_example_row)
+        self.insert_example_btn.clicked.connect(self._insert_starter_example)
+
+        return w
 
     def _init_tab_variables(self):
         w = QWidget()
         v = QVBoxLayout(w)
 
-        self.vars_table = QTableWidget(0, 2)
-        self.vars_table.setHorizontalHeaderLabels(["name", "value"])
+        self.vars_model = PairModel(("name", "value"), self)
+        self.vars_table = QTableView()
+        self.vars_table.setModel(self.vars_model)
         self.vars_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.vars_table.setEditTriggers(QAbstractItemView.AllEditTriggers)
         self.vars_table.horizontalHeader().setStretchLastSection(True)
@@ -511,7 +742,11 @@ class MainWindow(QMainWindow):
         v.addWidget(self.chk_swe)
         v.addWidget(self.chk_retail)
 
-        self.tabs.addTab(w, "Variables & Appendices")
+        self.add_var_btn.clicked.connect(self._add_var_row)
+        self.del_var_btn.clicked.connect(self._del_var_row)
+        self.insert_var_btn.clicked.connect(self._insert_starter_vars)
+
+        return w
 
     # ---- Event wiring ----
 
@@ -522,158 +757,144 @@ class MainWindow(QMainWindow):
         self.export_btn.clicked.connect(self._export_txt)
 
         self.load_preset_btn.clicked.connect(self._apply_preset)
-        self.add_example_btn.clicked.connect(self._add_example_row)
-        self.del_example_btn.clicked.connect(self._del_example_row)
-        self.insert_example_btn.clicked.connect(self._insert_starter_example)
-
-        self.add_var_btn.clicked.connect(self._add_var_row)
-        self.del_var_btn.clicked.connect(self._del_var_row)
-        self.insert_var_btn.clicked.connect(self._insert_starter_vars)
 
         self.load_btn.clicked.connect(self._load_settings)
         self.save_btn.clicked.connect(self._save_settings)
 
+        # Live preview: rebuild once typing pauses instead of on every keystroke
+        self._build_timer = QTimer(self)
+        self._build_timer.setSingleShot(True)
+        self._build_timer.setInterval(150)
+        self._build_timer.timeout.connect(self._refresh_preview)
+
+        self.tabs.currentChanged.connect(self._build_tab)
+        self._build_tab(self.tabs.currentIndex())
+
+    def _build_tab(self, idx: int):
+        builder = self._tab_builders.pop(idx, None)
+        if builder is None:
+            return
+        page = self.tabs.widget(idx)
+        page.layout().addWidget(builder())
+        self._watch_changes(page)
+
+    def _ensure_tabs(self):
+        # Reading or writing options needs every widget to exist
+        for idx in list(self._tab_builders):
+            self._build_tab(idx)
+
+    def _watch_changes(self, root: QWidget):
+        schedule = self._on_options_changed
+        for w in root.findChildren(QLineEdit) + root.findChildren(QTextEdit):
+            w.textChanged.connect(schedule)
+        for w in root.findChildren(QComboBox):
+            w.currentIndexChanged.connect(schedule)
+        for w in root.findChildren(QCheckBox):
+            w.toggled.connect(schedule)
+        for w in root.findChildren(QTableView):
+            model = w.model()
+            model.dataChanged.connect(schedule)
+            model.rowsInserted.connect(schedule)
+            model.rowsRemoved.connect(schedule)
+            model.modelReset.connect(schedule)
+
+    def _on_options_changed(self, *_):
+        self._options_cache = None
+        self._build_timer.start()
+
     # ---- Data marshaling ----
 
     def _collect_options(self) -> PromptOptions:
-        o = PromptOptions()
-        # Basics
-        o.role = self.role_combo.currentText()
-        o.custom_role = self.custom_role.text()
-        o.task = self.task_edit.toPlainText()
-        o.additional_context = self.context_edit.toPlainText()
-        o.audience = self.audience_edit.text()
-        o.constraints = self.constraints_edit.toPlainText()
-        o.delimiters = self.delim_combo.currentText()
-        o.output_format = self.output_format_combo.currentText()
-        o.json_schema = self.json_schema_edit.toPlainText()
-
-        # Agentic
-        o.eagerness = self.eager_combo.currentText()
-        o.reasoning_effort = self.reasoning_combo.currentText()
-        o.include_tool_preamble = self.chk_tool_preamble.isChecked()
-        o.include_persistence = self.chk_persistence.isChecked()
-        o.include_progress_narration = self.chk_progress.isChecked()
-        o.include_tool_disambiguation = self.chk_tool_rules.isChecked()
-        o.tool_context = self.tool_rules_edit.toPlainText()
-
-        # Coding
-        o.coding_mode = self.chk_coding.isChecked()
-        o.include_planning = self.chk_planning.isChecked()
-        o.planning_snippet = self.planning_edit.toPlainText()
-        o.include_apply_patch_instr = self.chk_apply_patch.isChecked()
-        o.include_tool_defs = self.chk_tool_defs.isChecked()
-        o.coding_notes = self.coding_notes.toPlainText()
-
-        # Intelligence
-        o.verbosity = self.verbosity_combo.currentText()
-        o.verbosity_override = self.verbosity_override.text()
-        o.markdown_guidance = self.chk_markdown.isChecked()
-        o.ask_brief_rationale = self.chk_brief_rationale.isChecked()
-
-        # Metaprompt
-        o.meta_mode = self.chk_meta_mode.isChecked()
-        o.meta_prompt = self.meta_prompt.toPlainText()
-        o.meta_desired = self.meta_desired.text()
-        o.meta_undesired = self.meta_undesired.text()
-
-        # Few-shot
-        o.examples = []
-        for r in range(self.examples_table.rowCount()):
-            u_item = self.examples_table.item(r, 0)
-            a_item = self.examples_table.item(r, 1)
-            u = u_item.text() if u_item else ""
-            a = a_item.text() if a_item else ""
-            if u.strip() or a.strip():
-                o.examples.append((u, a))
-
-        # Variables
-        o.variables = {}
-        for r in range(self.vars_table.rowCount()):
-            k_item = self.vars_table.item(r, 0)
-            v_item = self.vars_table.item(r, 1)
-            if k_item and v_item:
-                k = k_item.text().strip()
-                v = v_item.text()
-                if k:
-                    o.variables[k] = v
-
-        # Appendices
-        o.include_swe_bench = self.chk_swe.isChecked()
-        o.include_retail_min_reason = self.chk_retail.isChecked()
-
+        if self._options_cache is not None:
+            return self._options_cache
+        self._ensure_tabs()
+
+        variables = {}
+        for k, v in self.vars_model.rows():
+            k = k.strip()
+            if k:
+                variables[k] = v
+
+        o = PromptOptions(
+            # Basics
+            role=self.role_combo.currentText(),
+            custom_role=self.custom_role.text(),
+            task=self.task_edit.toPlainText(),
+            additional_context=self.context_edit.toPlainText(),
+            audience=self.audience_edit.text(),
+            constraints=self.constraints_edit.toPlainText(),
+            delimiters=self.delim_combo.currentText(),
+            output_format=self.output_format_combo.currentText(),
+            json_schema=self.json_schema_edit.toPlainText(),
+            # Agentic
+            eagerness=self.eager_combo.currentText(),
+            reasoning_effort=self.reasoning_combo.currentText(),
+            include_tool_preamble=self.chk_tool_preamble.isChecked(),
+            include_persistence=self.chk_persistence.isChecked(),
+            include_progress_narration=self.chk_progress.isChecked(),
+            include_tool_disambiguation=self.chk_tool_rules.isChecked(),
+            tool_context=self.tool_rules_edit.toPlainText(),
+            # Coding
+            coding_mode=self.chk_coding.isChecked(),
+            include_planning=self.chk_planning.isChecked(),
+            planning_snippet=self.planning_edit.toPlainText(),
+            include_apply_patch_instr=self.chk_apply_patch.isChecked(),
+            include_tool_defs=self.chk_tool_defs.isChecked(),
+            coding_notes=self.coding_notes.toPlainText(),
+            # Intelligence
+            verbosity=self.verbosity_combo.currentText(),
+            verbosity_override=self.verbosity_override.text(),
+            markdown_guidance=self.chk_markdown.isChecked(),
+            ask_brief_rationale=self.chk_brief_rationale.isChecked(),
+            # Metaprompt
+            meta_mode=self.chk_meta_mode.isChecked(),
+            meta_prompt=self.meta_prompt.toPlainText(),
+            meta_desired=self.meta_desired.text(),
+            meta_undesired=self.meta_undesired.text(),
+            # Few-shot
+            examples=[(u, a) for u, a in self.examples_model.rows() if u.strip() or a.strip()],
+            # Variables
+            variables=variables,
+            # Appendices
+            include_swe_bench=self.chk_swe.isChecked(),
+            include_retail_min_reason=self.chk_retail.isChecked(),
+        )
+        self._options_cache = o
         return o
 
     def _apply_options(self, o: PromptOptions):
-        # Basics
-        idx = self.role_combo.findText(o.role)
-        self.role_combo.setCurrentIndex(idx if idx >= 0 else 0)
-        self.custom_role.setText(o.custom_role)
-        self.task_edit.setPlainText(o.task)
-        self.context_edit.setPlainText(o.additional_context)
-        self.audience_edit.setText(o.audience)
-        self.constraints_edit.setPlainText(o.constraints)
-        self.delim_combo.setCurrentText(o.delimiters)
-        self.output_format_combo.setCurrentText(o.output_format)
-        self.json_schema_edit.setPlainText(o.json_schema)
-
-        # Agentic
-        self.eager_combo.setCurrentText(o.eagerness)
-        self.reasoning_combo.setCurrentText(o.reasoning_effort)
-        self.chk_tool_preamble.setChecked(o.include_tool_preamble)
-        self.chk_persistence.setChecked(o.include_persistence)
-        self.chk_progress.setChecked(o.include_progress_narration)
-        self.chk_tool_rules.setChecked(o.include_tool_disambiguation)
-        self.tool_rules_edit.setPlainText(o.tool_context)
-
-        # Coding
-        self.chk_coding.setChecked(o.coding_mode)
-        self.chk_planning.setChecked(o.include_planning)
-        self.planning_edit.setPlainText(o.planning_snippet)
-        self.chk_apply_patch.setChecked(o.include_apply_patch_instr)
-        self.chk_tool_defs.setChecked(o.include_tool_defs)
-        self.coding_notes.setPlainText(o.coding_notes)
-
-        # Intelligence
-        self.verbosity_combo.setCurrentText(o.verbosity)
-        self.verbosity_override.setText(o.verbosity_override)
-        self.chk_markdown.setChecked(o.markdown_guidance)
-        self.chk_brief_rationale.setChecked(o.ask_brief_rationale)
-
-        # Metaprompt
-        self.chk_meta_mode.setChecked(o.meta_mode)
-        self.meta_prompt.setPlainText(o.meta_prompt)
-        self.meta_desired.setText(o.meta_desired)
-        self.meta_undesired.setText(o.meta_undesired)
-
-        # Few-shot
-        self.examples_table.setRowCount(0)
-        for u, a in o.examples:
-            r = self.examples_table.rowCount()
-            self.examples_table.insertRow(r)
-            self.examples_table.setItem(r, 0, QTableWidgetItem(u))
-            self.examples_table.setItem(r, 1, QTableWidgetItem(a))
-
-        # Variables
-        self.vars_table.setRowCount(0)
-        for k, v in o.variables.items():
-            r = self.vars_table.rowCount()
-            self.vars_table.insertRow(r)
-            self.vars_table.setItem(r, 0, QTableWidgetItem(k))
-            self.vars_table.setItem(r, 1, QTableWidgetItem(v))
-
-        # Appendices
-        self.chk_swe.setChecked(o.include_swe_bench)
-        self.chk_retail.setChecked(o.include_retail_min_reason)
+        self._ensure_tabs()
+        # Programmatic updates should not fire each widget's change handlers;
+        # the preview is refreshed once at the end instead.
+        self.setUpdatesEnabled(False)
+        blockers = [QSignalBlocker(getattr(self, name)) for name, _, _ in _WIDGET_SETTERS]
+        blockers.append(QSignalBlocker(self.role_combo))
+        try:
+            idx = self.role_combo.findText(o.role)
+            self.role_combo.setCurrentIndex(idx if idx >= 0 else 0)
+            for name, setter, attr in _WIDGET_SETTERS:
+                getattr(getattr(self, name), setter)(getattr(o, attr))
+            self.examples_model.set_rows(o.examples)
+            self.vars_model.set_rows(o.variables.items())
+        finally:
+            for b in blockers:
+                b.unblock()
+            self.setUpdatesEnabled(True)
+            # Widgets may be partly updated even if a setter raised
+            self._on_options_changed()
 
     # ---- Actions ----
 
     def _build_prompt(self):
+        self._build_timer.stop()
+        self._refresh_preview()
+        self.statusBar().showMessage("Prompt built.")
+
+    def _refresh_preview(self):
         opts = self._collect_options()
         builder = PromptBuilder(opts)
         prompt = builder.build()
         self.output.setPlainText(prompt)
-        self.statusBar().showMessage("Prompt built.")
 
     def _copy_prompt(self):
         text = self.output.toPlainText().strip()
@@ -696,110 +917,136 @@ class MainWindow(QMainWindow):
 
     def _reset_all(self):
         self._apply_options(PromptOptions())
+        self._build_timer.stop()  # keep the output empty until the next edit
         self.output.clear()
         self.statusBar().showMessage("Reset.")
 
     def _apply_preset(self):
         which = self.preset_combo.currentText()
-        o = PromptOptions()
-        if which == "General task":
-            o.role = "General assistant"
-            o.markdown_guidance = True
-            o.verbosity = "Medium"
-            o.eagerness = "Medium"
-            o.delimiters = "triple backticks"
-        elif which == "Agentic low-eagerness":
-            o.include_persistence = True
-            o.include_tool_preamble = True
-            o.eagerness = "Low"
-            o.reasoning_effort = "Minimal"
-            o.ask_brief_rationale = False
-            o.markdown_guidance = True
-            o.verbosity = "Low"
-        elif which == "Agentic high-eagerness":
-            o.include_persistence = True
-            o.include_tool_preamble = True
-            o.include_progress_narration = True
-            o.include_tool_disambiguation = True
-            o.eagerness = "High"
-            o.reasoning_effort = "Medium"
-            o.markdown_guidance = True
-            o.verbosity = "Medium"
-        elif which == "Coding workflow":
-            o.role = "Coding assistant"
-            o.coding_mode = True
-            o.include_planning = True
-            o.include_apply_patch_instr = True
-            o.include_tool_defs = True
-            o.markdown_guidance = True
-            o.verbosity = "Medium"
-            o.reasoning_effort = "Medium"
-            o.include_persistence = True
-            o.eagerness = "Medium"
-        elif which == "Metaprompt optimizer":
-            o.meta_mode = True
-            o.verbosity = "Low"
-            o.markdown_guidance = False
-            o.eagerness = "Low"
+        o = replace(_PRESETS.get(which, PromptOptions()))
         self._apply_options(o)
         self.statusBar().showMessage(f"Applied preset: {which}")
 
     def _add_example_row(self):
-        r = self.examples_table.rowCount()
-        self.examples_table.insertRow(r)
-        self.examples_table.setItem(r, 0, QTableWidgetItem("User input here"))
-        self.examples_table.setItem(r, 1, QTableWidgetItem("Assistant reply here"))
+        self.examples_model.append_row("User input here", "Assistant reply here")
 
     def _del_example_row(self):
-        rows = sorted(set(idx.row() for idx in self.examples_table.selectedIndexes()), reverse=True)
-        for r in rows:
-            self.examples_table.removeRow(r)
+        self._remove_selected_rows(self.examples_table, self.examples_model)
 
     def _insert_starter_example(self):
-        r = self.examples_table.rowCount()
-        self.examples_table.insertRow(r)
-        self.examples_table.setItem(r, 0, QTableWidgetItem("Summarize this article for a technical audience."))
-        self.examples_table.setItem(r, 1, QTableWidgetItem("Summary focused on architecture decisions and trade-offs."))
+        self.examples_model.append_row("Summarize this article for a technical audience.",
+                                       "Summary focused on architecture decisions and trade-offs.")
 
     def _add_var_row(self):
-        r = self.vars_table.rowCount()
-        self.vars_table.insertRow(r)
-        self.vars_table.setItem(r, 0, QTableWidgetItem("PROJECT_NAME"))
-        self.vars_table.setItem(r, 1, QTableWidgetItem("MyApp"))
+        self.vars_model.append_row("PROJECT_NAME", "MyApp")
 
     def _del_var_row(self):
-        rows = sorted(set(idx.row() for idx in self.vars_table.selectedIndexes()), reverse=True)
-        for r in rows:
-            self.vars_table.removeRow(r)
+        self._remove_selected_rows(self.vars_table, self.vars_model)
 
     def _insert_starter_vars(self):
-        for k, v in {"LANG":"Python", "FRAMEWORK":"FastAPI", "DEADLINE":"2025-10-31"}.items():
-            r = self.vars_table.rowCount()
-            self.vars_table.insertRow(r)
-            self.vars_table.setItem(r, 0, QTableWidgetItem(k))
-            self.vars_table.setItem(r, 1, QTableWidgetItem(v))
+        self.vars_model.append_rows(_STARTER_VARS)
+
+    def _remove_selected_rows(self, view: QTableView, model: PairModel):
+        # The views select whole rows, so selectedRows() yields one index per row
+        rows = sorted((idx.row() for idx in view.selectionModel().selectedRows()), reverse=True)
+        # Remove each contiguous run with one removeRows call, bottom run first
+        # so the indices of the runs above stay valid. Repaint once at the end.
+        view.setUpdatesEnabled(False)
+        try:
+            i = 0
+            while i < len(rows):
+                hi = rows[i]
+                while i + 1 < len(rows) and rows[i + 1] == rows[i] - 1:
+                    i += 1
+                model.removeRows(rows[i], hi - rows[i] + 1)
+                i += 1
+        finally:
+            view.setUpdatesEnabled(True)
+
+    def _show_status(self, msg: str):
+        # Repeated saves/loads of the same file show the same text; skip the
+        # status bar relayout and repaint if it is still fresh on screen.
+        now = time.monotonic()
+        if msg == self.statusBar().currentMessage() and now - self._status_shown_at < 0.25:
+            return
+        self._status_shown_at = now
+        self.statusBar().showMessage(msg)
+
+    def _ask_settings_path(self, save: bool) -> str:
+        # The dialogs are created on first use and reused afterwards. Qt's own
+        # dialog skips the per-open shell enumeration of native dialogs and
+        # reopens in the last directory used.
+        dlg = self._save_dialog if save else self._open_dialog
+        if dlg is None:
+            dlg = QFileDialog(self, SAVE_SETTINGS_TITLE if save else LOAD_SETTINGS_TITLE)
+            dlg.setOption(QFileDialog.Option.DontUseNativeDialog)
+            dlg.setNameFilter(SETTINGS_FILTER)
+            if save:
+                dlg.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+                dlg.setFileMode(QFileDialog.FileMode.AnyFile)
+                dlg.setDefaultSuffix("json")
+                dlg.selectFile(SETTINGS_DEFAULT_NAME)
+                self._save_dialog = dlg
+            else:
+                dlg.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+                dlg.setFileMode(QFileDialog.FileMode.ExistingFile)
+                self._open_dialog = dlg
+        if not dlg.exec():
+            return ""
+        files = dlg.selectedFiles()
+        return files[0] if files else ""
+
+    def _settings_bytes(self, o: PromptOptions) -> bytes:
+        # _collect_options hands back the same object until an input changes,
+        # so identity is enough to reuse the last serialization.
+        cached = self._settings_cache
+        if cached is not None and cached[0] is o:
+            return cached[1]
+        if orjson is not None:
+            data = orjson.dumps(o, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(o.as_dict(), indent=2, ensure_ascii=False).encode("utf-8")
+        self._settings_cache = (o, data)
+        return data
 
     def _save_settings(self):
         o = self._collect_options()
-        data = json.dumps(o, default=lambda x: x.__dict__, indent=2, ensure_ascii=False)
-        path, _ = QFileDialog.getSaveFileName(self, "Save Settings", "prompt_settings.json", "JSON (*.json)")
+        path = self._ask_settings_path(save=True)
         if path:
-            with open(path, "w", encoding="utf-8") as f:
+            data = self._settings_bytes(o)
+            # One binary write; a payload larger than the buffer bypasses it entirely
+            with open(path, "wb") as f:
                 f.write(data)
-            self.statusBar().showMessage(f"Saved settings to {path}")
+            self._show_status(f"Saved settings to {path}")
 
     def _load_settings(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Load Settings", "", "JSON (*.json)")
+        path = self._ask_settings_path(save=False)
         if not path:
             return
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            o = PromptOptions(**data)
-            self._apply_options(o)
-            self.statusBar().showMessage(f"Loaded settings from {path}")
-        except Exception as e:
+            # Both parsers take the raw UTF-8 bytes; no decoded str copy is made
+            with open(path, "rb") as f:
+                raw = f.read()
+        except OSError as e:
             QMessageBox.critical(self, "Error", f"Failed to load: {e}")
+            return
+        # A malformed or mismatched settings file is reported in the status bar
+        try:
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            if not isinstance(data, dict):
+                raise ValueError("expected a JSON object")
+            check_settings(data)
+            variables = data.get("variables")
+            if variables is not None:
+                # Variable names recur across saves/loads and are dict keys; share them
+                data["variables"] = {sys.intern(k): v for k, v in variables.items()}
+            # Ignore keys from newer/older versions instead of failing the whole load
+            o = PromptOptions(**{k: v for k, v in data.items() if k in PromptOptions.__dataclass_fields__})
+            self._apply_options(o)
+        except (ValueError, TypeError) as e:
+            self.statusBar().showMessage(f"Load failed: {e}", 5000)
+            return
+        self._show_status(f"Loaded settings from {path}")
 
 def main():
     app = QApplication(sys.argv)